@@ -2,7 +2,8 @@
 STATUS_UPDATE_DELAY = 2.0
 
 # Minecraft detection constants
-MINECRAFT_EXECUTABLES = ("javaw.exe", "java.exe")
+MINECRAFT_EXECUTABLES = frozenset({"javaw.exe", "java.exe"})
+FOREGROUND_PROCESS_CACHE_SIZE = 32
 
 # Keyboard constants
 MINECRAFT_CHAT_KEY = 't'
@@ -10,8 +10,12 @@ class AudioSettings:
     channels: int = 1
     dtype: str = 'float32'
     whisper_model: str = 'small'
-    compute_type: str = 'int8'
-    beam_size: int = 3
+    device: str = None
+    compute_type: str = None
+    beam_size: int = 1
+    vad_filter: bool = True
+    without_timestamps: bool = True
+    condition_on_previous_text: bool = False
     models_directory: str = None
 
     def __post_init__(self):
@@ -1,5 +1,7 @@
 import logging
+import queue
 import threading
+import numpy as np
 from typing import Callable, Optional
 
 from core.audio.voice_recorder import VoiceRecorder
@@ -12,7 +14,7 @@ class AudioProcessor:
     
     def __init__(
         self, 
-        transcription_callback: Callable[[str], None],
+        transcription_callback: Callable[[Optional[str], str], None],
         model_ready_callback: Optional[Callable[[bool], None]] = None,
         status_callback: Optional[Callable[[str], None]] = None
     ):
@@ -24,6 +26,15 @@ class AudioProcessor:
         self._voice_recorder = VoiceRecorder(buffer_full_callback=self._on_buffer_full)
         self._speech_recognizer = SpeechRecognizer(self._on_model_ready)
         
+        # Single long-lived worker keeps transcription off the hotkey thread
+        self._audio_queue: queue.Queue = queue.Queue()
+        self._worker_thread = threading.Thread(
+            target=self._worker_loop,
+            daemon=True,
+            name="AudioProcessor"
+        )
+        self._worker_thread.start()
+        
     def initialize_model(self) -> None:
         """Initialize the speech recognition model asynchronously."""
         self._logger.info("Initializing speech recognition model")
@@ -55,35 +66,39 @@ class AudioProcessor:
         except Exception as error:
             raise AudioProcessingError(f"Failed to start recording: {error}")
     
-    def stop_recording_and_process(self) -> None:
-        """Stop recording and process audio in a separate thread."""
+    def stop_recording_and_process(self, prefix: str) -> None:
+        """Stop recording and queue the audio, tagged with its prefix, for the processing worker."""
         if not self._voice_recorder.is_recording:
             self._logger.warning("No recording in progress")
             return
             
         try:
             audio_data = self._voice_recorder.stop_recording()
-            processing_thread = threading.Thread(
-                target=self._process_audio,
-                args=(audio_data,),
-                daemon=True,
-                name="AudioProcessor"
-            )
-            processing_thread.start()
+            self._audio_queue.put((audio_data, prefix))
             
         except AudioProcessingError as error:
-            self._logger.error(f"Recording failed: {error}")
-            self._transcription_callback(None)
+            self._logger.error("Recording failed: %s", error)
+            self._transcription_callback(None, prefix)
+    
+    def _worker_loop(self) -> None:
+        """Process queued recordings one at a time."""
+        while True:
+            audio_data, prefix = self._audio_queue.get()
+            try:
+                self._process_audio(audio_data, prefix)
+            except Exception as error:
+                # Keep the worker alive for the next recording
+                self._logger.error("Unexpected error while processing audio: %s", error)
     
-    def _process_audio(self, audio_data) -> None:
+    def _process_audio(self, audio_data: np.ndarray, prefix: str) -> None:
         """Process audio data and call transcription callback."""
         try:
             transcribed_text = self._speech_recognizer.transcribe(audio_data)
-            self._transcription_callback(transcribed_text)
+            self._transcription_callback(transcribed_text, prefix)
             
         except AudioProcessingError as error:
-            self._logger.error(f"Audio processing failed: {error}")
-            self._transcription_callback(None)
+            self._logger.error("Audio processing failed: %s", error)
+            self._transcription_callback(None, prefix)
     
     @property
     def is_recording(self) -> bool:
@@ -1,15 +1,70 @@
+import functools
 import logging
 import numpy as np
-import time
 import threading
-from typing import Optional, Callable
+from typing import Optional, Callable, Tuple
+import ctranslate2
 from faster_whisper import WhisperModel
+from faster_whisper.vad import VadOptions, get_speech_timestamps
 
 from config.settings import app_settings
 from config.constants import DEFAULT_SENTENCE_ENDINGS
 from utils.exceptions import AudioProcessingError
 
 
+_SENTENCE_ENDINGS = frozenset(DEFAULT_SENTENCE_ENDINGS)
+# Fastest first; older GPUs (compute capability < 7.0) lack the float16 variants
+_CUDA_COMPUTE_TYPES = ('int8_float16', 'float16', 'int8_float32', 'int8', 'float32')
+_VAD_OPTIONS = VadOptions(min_silence_duration_ms=500)
+_model_cache_lock = threading.Lock()
+
+
+def _decode_options() -> dict:
+    """Whisper decode arguments shared by warm-up and real transcription."""
+    audio_settings = app_settings.audio
+    return {
+        'language': 'en',
+        'vad_filter': False,  # Silero VAD runs separately in SpeechRecognizer._trim_to_speech
+        'beam_size': audio_settings.beam_size,
+        'best_of': 1,
+        'temperature': 0.0,
+        'condition_on_previous_text': audio_settings.condition_on_previous_text,
+        'without_timestamps': audio_settings.without_timestamps
+    }
+
+
+@functools.lru_cache(maxsize=4)
+def _load_whisper_model(
+        model_name: str,
+        device: str,
+        compute_type: str,
+        download_root: str
+    ) -> WhisperModel:
+    """Load and warm up a Whisper model, reused for identical settings."""
+    logger = logging.getLogger(__name__)
+    logger.info("Loading Whisper model '%s' from %s (%s, %s)", model_name, download_root, device, compute_type)
+    
+    model = WhisperModel(
+        model_name,
+        device=device,
+        compute_type=compute_type,
+        download_root=download_root
+    )
+    
+    # A failed warm-up (e.g. missing CUDA libraries) fails the load instead of every later utterance
+    warmup_audio = np.zeros(app_settings.audio.sample_rate, dtype=np.float32)
+    
+    # Also builds faster-whisper's lazily created Silero session used before each transcription
+    if app_settings.audio.vad_filter:
+        get_speech_timestamps(warmup_audio, _VAD_OPTIONS)
+    
+    segments, _ = model.transcribe(warmup_audio, **_decode_options())
+    list(segments)
+    logger.info("Whisper model warm-up completed")
+    
+    return model
+
+
 class SpeechRecognizer:
     """Handles speech-to-text conversion using Whisper."""
     
@@ -21,7 +76,7 @@ class SpeechRecognizer:
         self._model_ready_callback = model_ready_callback
         self._is_model_loading = False
         self._is_model_ready = False
-        self._model_load_lock = threading.Lock()
+        self._model_loaded_event = threading.Event()
         
     def initialize_model_async(self) -> None:
         """Initialize the Whisper model asynchronously."""
@@ -39,32 +94,80 @@ class SpeechRecognizer:
         initialization_thread.start()
     
     def _load_model_sync(self) -> None:
-        """Synchronously load the Whisper model."""
+        """Synchronously load the Whisper model, reusing it if already loaded."""
         try:
-            with self._model_load_lock:
-                if self._model is not None:
-                    return
-                    
-                self._logger.info(f"Loading Whisper model '{self._audio_settings.whisper_model}' from {self._model_dir}")
+            device, compute_type = self._resolve_device()
+            
+            try:
+                self._model = self._load_model(device, compute_type)
+            except Exception as e:
+                # Only an automatically chosen GPU falls back; an explicit device fails hard
+                if device == 'cpu' or self._audio_settings.device is not None:
+                    raise
                 
-                self._model = WhisperModel(
-                    self._audio_settings.whisper_model,
-                    compute_type=self._audio_settings.compute_type,
-                    download_root=str(self._model_dir)
-                )
-
-                self._is_model_ready = True
-                self._logger.info(f"Whisper model '{self._audio_settings.whisper_model}' loaded successfully")
+                self._logger.warning("Loading on %s (%s) failed, falling back to CPU: %s", device, compute_type, e)
+                self._model = self._load_model('cpu', 'int8')
+                
+            self._is_model_ready = True
+            self._logger.info("Whisper model '%s' is ready", self._audio_settings.whisper_model)
                 
         except Exception as e:
-            self._logger.error(f"Failed to load Whisper model: {e}")
+            self._logger.error("Failed to load Whisper model: %s", e)
             self._is_model_ready = False
             
         finally:
             self._is_model_loading = False
+            self._model_loaded_event.set()
             if self._model_ready_callback:
                 self._model_ready_callback(self._is_model_ready)
+
+    def _load_model(self, device: str, compute_type: str) -> WhisperModel:
+        """Load the configured Whisper model through the shared cache."""
+        with _model_cache_lock:
+            return _load_whisper_model(
+                self._audio_settings.whisper_model,
+                device,
+                compute_type,
+                str(self._model_dir)
+            )
+
+    def _resolve_device(self) -> Tuple[str, str]:
+        """Pick the inference device and compute type, preferring CUDA when available."""
+        device = self._audio_settings.device
+        if device is None:
+            device = 'cuda' if self._is_cuda_available() else 'cpu'
+        
+        compute_type = self._audio_settings.compute_type
+        if compute_type is None:
+            compute_type = self._pick_compute_type(device)
+            
+        return device, compute_type
     
+    def _pick_compute_type(self, device: str) -> str:
+        """Pick the fastest compute type the device actually supports."""
+        if device == 'cpu':
+            return 'int8'
+        
+        try:
+            supported = ctranslate2.get_supported_compute_types(device)
+        except Exception as e:
+            self._logger.debug("Compute type detection failed: %s", e)
+            return 'default'
+        
+        for compute_type in _CUDA_COMPUTE_TYPES:
+            if compute_type in supported:
+                return compute_type
+            
+        return 'default'
+    
+    def _is_cuda_available(self) -> bool:
+        """Check whether CTranslate2 can see a CUDA device."""
+        try:
+            return ctranslate2.get_cuda_device_count() > 0
+        except Exception as e:
+            self._logger.debug("CUDA detection failed: %s", e)
+            return False
+
     def wait_for_model(self, timeout: Optional[float] = None) -> bool:
         """Wait for the model to be ready."""
         if self._is_model_ready:
@@ -74,23 +177,26 @@ class SpeechRecognizer:
             self._logger.warning("Model is not loading. Call initialize_model_async() first.")
             return False
         
-        start_time = time.time()
-        poll_interval = 0.1
-        
-        while self._is_model_loading:
-            if timeout and (time.time() - start_time) > timeout:
-                self._logger.warning(f"Model loading timeout after {timeout} seconds")
-                return False
-                
-            time.sleep(poll_interval)
+        if not self._model_loaded_event.wait(timeout=timeout):
+            self._logger.warning("Model loading timeout after %s seconds", timeout)
+            return False
         
         return self._is_model_ready
     
     def transcribe(self, audio_data: np.ndarray) -> str:
         """Transcribe audio data to text."""
+        # CTranslate2 copies anything that isn't contiguous float32; this is a no-op otherwise
+        audio_data = np.ascontiguousarray(audio_data, dtype=np.float32)
+        
         if audio_data.size == 0:
             raise AudioProcessingError("No audio data provided")
         
+        if self._audio_settings.vad_filter:
+            audio_data = self._trim_to_speech(audio_data)
+            if audio_data.size == 0:
+                self._logger.info("No speech detected by VAD, skipping transcription")
+                return ""
+        
         if not self._is_model_ready:
             if self._is_model_loading:
                 self._logger.info("Waiting for model to finish loading...")
@@ -103,43 +209,41 @@ class SpeechRecognizer:
             if self._model is None:
                 raise AudioProcessingError("Model is None despite being marked as ready")
             
-            segments, _ = self._model.transcribe(
-                audio_data, 
-                language='en',
-                vad_filter=True, 
-                vad_parameters=dict(min_silence_duration_ms=500),
-                beam_size=self._audio_settings.beam_size,
-                best_of=1,
-                temperature=0.0,
-                condition_on_previous_text=False
-            )
+            segments, _ = self._model.transcribe(audio_data, **_decode_options())
                 
-            text = ''.join([segment.text for segment in segments]).strip()
+            text = ''.join(segment.text for segment in segments).strip()
             
             if not text:
                 return ""
                 
             formatted_text = self._format_text(text)
-            self._logger.info(f"Transcribed text: '{formatted_text}'")
+            self._logger.info("Transcribed text: '%s'", formatted_text)
             
             return formatted_text
             
         except Exception as e:
             raise AudioProcessingError(f"Transcription failed: {e}")
     
+    def _trim_to_speech(self, audio_data: np.ndarray) -> np.ndarray:
+        """Keep only the speech segments detected by Silero VAD."""
+        try:
+            speech_chunks = get_speech_timestamps(audio_data, _VAD_OPTIONS)
+        except Exception as e:
+            raise AudioProcessingError(f"Voice activity detection failed: {e}")
+        
+        if not speech_chunks:
+            return audio_data[:0]
+        
+        return np.concatenate([audio_data[chunk['start']:chunk['end']] for chunk in speech_chunks])
+    
     def _format_text(self, text: str) -> str:
         """Format transcribed text with proper capitalization and punctuation."""
         if not text:
             return text
             
-        # Capitalize first letter
-        formatted = text[0].upper() + text[1:] if len(text) > 1 else text.upper()
-        
-        # Add punctuation if missing
-        if not formatted.endswith(DEFAULT_SENTENCE_ENDINGS):
-            formatted += "."
-            
-        return formatted
+        # Capitalize first letter and add punctuation if missing
+        ending = "" if text[-1] in _SENTENCE_ENDINGS else "."
+        return text[0].upper() + text[1:] + ending
     
     @property
     def is_model_ready(self) -> bool:
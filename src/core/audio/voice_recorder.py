@@ -2,7 +2,6 @@ import logging
 import sounddevice as sd
 import numpy as np
 from typing import Optional, Callable
-from threading import Lock
 
 from config.settings import app_settings
 from utils.exceptions import AudioProcessingError
@@ -25,7 +24,6 @@ class VoiceRecorder:
         self._stream: Optional[sd.InputStream] = None
         self._is_recording = False
         self._stream_active = False 
-        self._buffer_lock = Lock()
         
     def start_recording(self) -> None:
         """Start audio recording."""
@@ -67,16 +65,16 @@ class VoiceRecorder:
             return np.array([], dtype=np.float32)
         
         try:
+            # Stopping the stream waits for the last callback, so the buffer is stable after this
             self._cleanup_stream()
-                
-            with self._buffer_lock:
-                if self._buffer_position == 0:
-                    raise AudioProcessingError("No audio data captured")
-                
-                # Return only the recorded portion
-                audio_data = self._audio_buffer[:self._buffer_position].copy()
-                
-            self._logger.info(f"Recording stopped: {self._buffer_position} samples captured")
+            
+            if self._buffer_position == 0:
+                raise AudioProcessingError("No audio data captured")
+            
+            # Return only the recorded portion
+            audio_data = self._audio_buffer[:self._buffer_position].copy()
+            
+            self._logger.info("Recording stopped: %s samples captured", self._buffer_position)
             return audio_data
             
         except Exception as e:
@@ -91,33 +89,32 @@ class VoiceRecorder:
                     self._stream.stop()
                 self._stream.close()
             except Exception as error:
-                self._logger.warning(f"Error cleaning up stream: {error}")
+                self._logger.warning("Error cleaning up stream: %s", error)
             finally:
                 self._stream = None
     
     def _audio_callback(self, indata: np.ndarray, frames, _time_info, status) -> None:
         """Audio stream callback function."""
+        # Only writer of the buffer; stop_recording reads it after the stream stops, so no lock
         if not self._is_recording:
             return
             
-        with self._buffer_lock:
-            chunk = indata[:, 0] if indata.ndim > 1 else indata.flatten()
-            chunk_size = len(chunk)
-            
-            # Check if we have space
-            if self._buffer_position + chunk_size > self._max_samples:
-                self._logger.warning(f"Recording buffer full ({self._max_recording_duration}s limit reached)")
-                self._is_recording = False  # stop accepting data but stream cleanup happens in stop_recording
-                
-                if self._buffer_full_callback:
-                    self._buffer_full_callback(
-                        f"Recording stopped: {self._max_recording_duration}s buffer limit reached"
-                    )
-                return
+        chunk_size = indata.shape[0]
+
+        # Check if we have space
+        if self._buffer_position + chunk_size > self._max_samples:
+            self._logger.warning("Recording buffer full (%ss limit reached)", self._max_recording_duration)
+            self._is_recording = False  # stop accepting data but stream cleanup happens in stop_recording
             
-            # Copy directly into pre-allocated buffer
-            self._audio_buffer[self._buffer_position:self._buffer_position + chunk_size] = chunk
-            self._buffer_position += chunk_size
+            if self._buffer_full_callback:
+                self._buffer_full_callback(
+                    f"Recording stopped: {self._max_recording_duration}s buffer limit reached"
+                )
+            return
+        
+        # PortAudio reuses indata, so this slice assignment is the block's only copy
+        self._audio_buffer[self._buffer_position:self._buffer_position + chunk_size] = indata[:, 0]
+        self._buffer_position += chunk_size
     
     @property
     def is_recording(self) -> bool:
@@ -1,4 +1,5 @@
 import logging
+from functools import partial
 from typing import Dict, Callable, Set
 from threading import Lock
 
@@ -19,7 +20,7 @@ class HotkeyManager:
         self._logger = logging.getLogger(__name__)
         self._validate_hotkey_mappings(hotkey_mappings)
         
-        self._hotkey_mappings = hotkey_mappings
+        self._hotkey_mappings = hotkey_mappings.copy()
         self._start_callback = start_callback
         self._stop_callback = stop_callback
         
@@ -46,40 +47,46 @@ class HotkeyManager:
     def start_monitoring(self) -> None:
         """Start monitoring hotkeys."""
         self._is_running = True
+        self._register_hooks()
 
+        self._logger.info("Started keyboard monitoring for: %s", list(self._hotkey_mappings.keys()))
+    
+    def stop_monitoring(self) -> None:
+        """Stop monitoring hotkeys and cleanup"""
+        if not self._is_running:
+            return
+        
+        self._is_running = False
+        self._unregister_hooks()
+
+        with self._key_lock:
+            self._pressed_keys.clear()
+
+        self._logger.info("Stopped hotkey monitoring")
+
+    def _register_hooks(self) -> None:
+        """Install press/release hooks for every mapped hotkey."""
         for hotkey, prefix in self._hotkey_mappings.items():
             press_hook = keyboard.on_press_key(
                 hotkey.lower(),
-                lambda e, p=prefix: self._on_key_down(p),
+                partial(self._on_key_down, prefix),
                 suppress=False
             )
             release_hook = keyboard.on_release_key(
                 hotkey.lower(),
-                lambda e, p=prefix: self._on_key_up(p),
+                partial(self._on_key_up, prefix),
                 suppress=False
             )
             self._hooks.extend([press_hook, release_hook])
 
-        self._logger.info(f"Started keyboard monitoring for: {list(self._hotkey_mappings.keys())}")
-    
-    def stop_monitoring(self) -> None:
-        """Stop monitoring hotkeys and cleanup"""
-        if not self._is_running:
-            return
-        
-        self._is_running = False
-
+    def _unregister_hooks(self) -> None:
+        """Remove all installed keyboard hooks."""
         for hook in self._hooks:
             keyboard.unhook(hook)
 
         self._hooks.clear()
 
-        with self._key_lock:
-            self._pressed_keys.clear()
-
-        self._logger.info("Stopped hotkey monitoring")
-
-    def _on_key_down(self, prefix: str) -> None:
+    def _on_key_down(self, prefix: str, _event=None) -> None:
         if not self._is_running:
             return
         
@@ -88,7 +95,7 @@ class HotkeyManager:
                 self._pressed_keys.add(prefix)
                 self._start_callback(prefix)
 
-    def _on_key_up(self, prefix: str) -> None:
+    def _on_key_up(self, prefix: str, _event=None) -> None:
         if not self._is_running:
             return
         
@@ -105,5 +112,10 @@ class HotkeyManager:
             self._hotkey_mappings = new_mappings.copy()
             self._pressed_keys.clear()
         
-        self._logger.info(f"Updated hotkey mappings: {new_mappings}")
+        # Hooks capture their prefix, so re-register them while monitoring
+        if self._is_running:
+            self._unregister_hooks()
+            self._register_hooks()
+        
+        self._logger.info("Updated hotkey mappings: %s", new_mappings)
 
@@ -1,3 +1,4 @@
+import functools
 import logging
 import time
 import pyperclip
@@ -7,12 +8,18 @@ from config.constants import MINECRAFT_CHAT_KEY, ENTER_KEY_DELAY
 from utils.exceptions import MessageSendError
 
 
+@functools.lru_cache(maxsize=1)
+def _get_shared_controller() -> Controller:
+    """Get the process-wide pynput keyboard controller."""
+    return Controller()
+
+
 class KeyboardController:
     """Handles keyboard input simulation."""
     
     def __init__(self):
         self._logger = logging.getLogger(__name__)
-        self._controller = Controller()
+        self._controller = _get_shared_controller()
     
     def send_message_to_minecraft(self, message: str, auto_send: bool = True) -> None:
         """Send a message to Minecraft chat using clipboard paste."""
@@ -38,9 +45,9 @@ class KeyboardController:
             
             if auto_send:
                 self.simulate_key_press(Key.enter)
-                self._logger.info(f"Sent to Minecraft chat: '{message}'")
+                self._logger.info("Sent to Minecraft chat: '%s'", message)
             else:
-                self._logger.info(f"Typed in Minecraft chat: '{message}' (manual send)")
+                self._logger.info("Typed in Minecraft chat: '%s' (manual send)", message)
             
             # restore clipboard to prev state after everything is done
             if original_clipboard is not None:
@@ -59,5 +66,5 @@ class KeyboardController:
             self._controller.press(key)
             self._controller.release(key)
         except Exception as error:
-            self._logger.error(f"Failed to simulate key press for '{key}': {error}")
+            self._logger.error("Failed to simulate key press for '%s': %s", key, error)
 
@@ -2,8 +2,9 @@ import logging
 import win32gui
 import win32process
 import psutil
-from typing import Tuple, Optional
-from config.constants import MINECRAFT_EXECUTABLES
+from collections import OrderedDict
+from typing import Optional
+from config.constants import MINECRAFT_EXECUTABLES, FOREGROUND_PROCESS_CACHE_SIZE
 
 
 class MinecraftDetector:
@@ -11,39 +12,56 @@ class MinecraftDetector:
     
     def __init__(self):
         self._logger = logging.getLogger(__name__)
+        self._exe_name_cache: OrderedDict[int, str] = OrderedDict()
+        
+        # Bound once so the focus check avoids repeated module attribute lookups
+        self._get_foreground_window = win32gui.GetForegroundWindow
+        self._get_window_thread_process_id = win32process.GetWindowThreadProcessId
+        self._process = psutil.Process
+        
+        # Last answer, reused while the same window stays in the foreground
+        self._last_hwnd: Optional[int] = None
+        self._last_is_focused = False
     
     def is_minecraft_focused(self) -> bool:
         """Check if Minecraft is currently the focused application."""
         try:
-            exe_name, _ = self._get_foreground_process_info()
+            hwnd = self._get_foreground_window()
             
-            if exe_name is None:
-                return False
+            if hwnd != self._last_hwnd:
+                exe_name = self._get_exe_name(hwnd)
                 
-            is_focused = exe_name.lower() in MINECRAFT_EXECUTABLES
+                if exe_name is None:
+                    return False
+                    
+                self._last_is_focused = exe_name in MINECRAFT_EXECUTABLES
+                self._last_hwnd = hwnd
             
-            if is_focused:
+            if self._last_is_focused:
                 self._logger.debug("Minecraft is focused")
             
-            return is_focused
+            return self._last_is_focused
             
         except Exception as error:
-            self._logger.error(f"Error checking Minecraft focus: {error}")
+            self._logger.error("Error checking Minecraft focus: %s", error)
             return False
     
-    def _get_foreground_process_info(self) -> Tuple[Optional[str], Optional[str]]:
-        """Get information about the foreground process."""
+    def _get_exe_name(self, hwnd: int) -> Optional[str]:
+        """Get the lowercase executable name of a window's process."""
         try:
-            hwnd = win32gui.GetForegroundWindow()
-            _, pid = win32process.GetWindowThreadProcessId(hwnd)
+            exe_name = self._exe_name_cache.get(hwnd)
+            if exe_name is not None:
+                return exe_name
             
-            process = psutil.Process(pid)
-            exe_name = process.name()
-            command_line = ' '.join(process.cmdline())
+            _, pid = self._get_window_thread_process_id(hwnd)
+            exe_name = self._process(pid).name().lower()
             
-            return exe_name, command_line
+            self._exe_name_cache[hwnd] = exe_name
+            if len(self._exe_name_cache) > FOREGROUND_PROCESS_CACHE_SIZE:
+                self._exe_name_cache.popitem(last=False)
+            
+            return exe_name
             
         except (psutil.NoSuchProcess, psutil.AccessDenied, Exception) as error:
-            self._logger.debug(f"Could not get process info: {error}")
-            return None, None
-
+            self._logger.debug("Could not get process info: %s", error)
+            return None
@@ -24,14 +24,14 @@ class MessageSender:
             self._keyboard_controller.send_message_to_minecraft(message, send_mode)
             
             if send_mode:
-                self._logger.info(f"Message sent automatically: '{message}'")
+                self._logger.info("Message sent automatically: '%s'", message)
             else:
-                self._logger.info(f"Message typed for manual send: '{message}'")
+                self._logger.info("Message typed for manual send: '%s'", message)
                 
         except Exception as e:
             raise MessageSendError(f"Failed to send message '{message}': {e}")
     
     def set_auto_send(self, auto_send: bool) -> None:
         self._auto_send = auto_send
-        self._logger.info(f"Auto-send mode set to: {auto_send}")
+        self._logger.info("Auto-send mode set to: %s", auto_send)
 
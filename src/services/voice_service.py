@@ -1,5 +1,4 @@
 import logging
-import time
 import threading
 from typing import Dict, Callable, Optional
 
@@ -18,13 +17,16 @@ class VoiceService:
             hotkey_mappings: Dict[str, str],
             status_callback: Optional[Callable[[str], None]] = None,
             model_ready_callback: Optional[Callable[[bool], None]] = None,
-            auto_send: bool = True
+            auto_send: bool = True,
+            schedule_callback: Optional[Callable[[int, Callable[[], None]], None]] = None
         ):
         self._logger = logging.getLogger(__name__)
         self._hotkey_mappings = hotkey_mappings
         self._status_callback = status_callback
         self._model_ready_callback = model_ready_callback
         self._auto_send = auto_send
+        self._schedule_callback = schedule_callback
+        self._update_send_mode_text()
         
         # Initialize components
         self._audio_processor = AudioProcessor(
@@ -43,8 +45,9 @@ class VoiceService:
         # State management
         self._is_running = False
         self._current_prefix = ""
+        self._current_message_prefix = ""
         
-        self._update_status(f"Voice service initialized ({'auto-send' if auto_send else 'manual-send'})")
+        self._update_status(f"Voice service initialized ({self._send_mode})")
     
     def initialize_model(self) -> None:
         """Initialize the speech recognition model."""
@@ -55,8 +58,7 @@ class VoiceService:
     def _on_model_ready(self, is_ready: bool) -> None:
         """Handle model ready callback."""
         if is_ready:
-            send_mode = "auto-send" if self._auto_send else "manual-send"
-            self._update_status(f"Model loaded successfully! Ready to start ({send_mode})")
+            self._update_status(f"Model loaded successfully! Ready to start ({self._send_mode})")
         else:
             self._update_status("Failed to load speech recognition model")
             
@@ -76,9 +78,8 @@ class VoiceService:
         self._is_running = True
         self._hotkey_manager.start_monitoring()
         
-        send_mode = "auto-send" if self._auto_send else "manual-send"
-        self._update_status(f"Started ({send_mode}). Use configured hotkeys to record")
-        self._logger.info(f"VC service started with hotkeys: {self._hotkey_mappings}")
+        self._update_status(f"Started ({self._send_mode}). Use configured hotkeys to record")
+        self._logger.info("VC service started with hotkeys: %s", self._hotkey_mappings)
     
     def stop(self) -> None:
         """Stop the voice chat service."""
@@ -95,10 +96,15 @@ class VoiceService:
     def set_auto_send(self, auto_send: bool) -> None:
         """Update auto-send setting."""
         self._auto_send = auto_send
+        self._update_send_mode_text()
         self._message_sender.set_auto_send(auto_send)
         
-        send_mode = "auto-send" if auto_send else "manual-send"
-        self._logger.info(f"Auto-send mode changed to: {send_mode}")
+        self._logger.info("Auto-send mode changed to: %s", self._send_mode)
+    
+    def _update_send_mode_text(self) -> None:
+        """Cache the send mode strings used in status messages."""
+        self._send_mode = "auto-send" if self._auto_send else "manual-send"
+        self._idle_status = f"Use hotkeys to speak ({self._send_mode})"
     
     def update_hotkey_mappings(self, new_mappings: Dict[str, str]) -> None:
         """Update hotkey mappings."""
@@ -119,29 +125,29 @@ class VoiceService:
             return
             
         self._current_prefix = prefix
+        self._current_message_prefix = f"{prefix} " if prefix else ""
         try:
             self._audio_processor.start_recording()
-            send_mode = "auto-send" if self._auto_send else "manual-send"
-            self._update_status(f"Recording with prefix '{prefix}' ({send_mode})...")
+            self._update_status(f"Recording with prefix '{prefix}' ({self._send_mode})...")
         except Exception as error:
-            self._logger.error(f"Failed to start recording: {error}")
+            self._logger.error("Failed to start recording: %s", error)
             self._update_status(f"Recording error")
     
     def _on_hotkey_released(self, prefix: str) -> None:
         """Handle hotkey release event."""
         if self._audio_processor.is_recording and self._current_prefix == prefix:
-            self._audio_processor.stop_recording_and_process()
+            self._audio_processor.stop_recording_and_process(self._current_message_prefix)
             self._update_status("Processing...")
     
-    def _on_transcription_complete(self, transcribed_text: str) -> None:
-        """Handle completed transcription."""
+    def _on_transcription_complete(self, transcribed_text: Optional[str], message_prefix: str) -> None:
+        """Handle completed transcription for the recording made with the given message prefix."""
         if not transcribed_text:
             self._update_status("No speech detected")
             self._schedule_status_reset()
             return
             
         # Format message with prefix
-        message = self._format_message(transcribed_text, self._current_prefix)
+        message = self._format_message(transcribed_text, message_prefix)
         
         try:
             if self._auto_send:
@@ -152,25 +158,28 @@ class VoiceService:
                 self._message_sender.send_message(message, auto_send=False)
                 
         except Exception as error:
-            self._logger.error(f"Failed to send message: {error}")
+            self._logger.error("Failed to send message: %s", error)
             self._update_status(f"Send error: {error}")
         
         self._schedule_status_reset()
     
-    def _format_message(self, text: str, prefix: str) -> str:
-        """Format message with prefix."""
-        if prefix:
-            return f"{prefix} {text}"
-        return text
+    def _format_message(self, text: str, message_prefix: str) -> str:
+        """Format message with prefix (already followed by a space when set)."""
+        return message_prefix + text
     
     def _schedule_status_reset(self) -> None:
         """Schedule status reset after delay."""
-        def reset_status():
-            time.sleep(STATUS_UPDATE_DELAY)
-            send_mode = "auto-send" if self._auto_send else "manual-send"
-            self._update_status(f"Use hotkeys to speak ({send_mode})")
+        if self._schedule_callback:
+            self._schedule_callback(int(STATUS_UPDATE_DELAY * 1000), self._reset_status)
+            return
         
-        threading.Thread(target=reset_status, daemon=True, name="StatusReset").start()
+        timer = threading.Timer(STATUS_UPDATE_DELAY, self._reset_status)
+        timer.daemon = True
+        timer.start()
+    
+    def _reset_status(self) -> None:
+        """Reset status to the idle hint."""
+        self._update_status(self._idle_status)
     
     def _update_status(self, message: str) -> None:
         """Update status through callback."""
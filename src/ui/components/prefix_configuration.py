@@ -5,6 +5,22 @@ from typing import Dict, Callable, Optional
 from config.settings import PrefixConfig
 
 
+# Fonts shared by every prefix row, created once a Tk root exists
+_fonts: Dict[str, ctk.CTkFont] = {}
+
+
+def _get_fonts() -> Dict[str, ctk.CTkFont]:
+    """Get the shared prefix row fonts, creating them on first use."""
+    if not _fonts:
+        _fonts.update({
+            'label': ctk.CTkFont(size=13, weight="bold"),
+            'entry': ctk.CTkFont(size=12),
+            'hotkey': ctk.CTkFont(size=12, weight="bold"),
+            'button': ctk.CTkFont(size=11, weight="bold")
+        })
+    return _fonts
+
+
 class PrefixConfigurationWidget:
     """Widget for managing prefix configurations."""
     
@@ -32,6 +48,8 @@ class PrefixConfigurationWidget:
     
     def _create_widgets(self) -> None:
         """Create the widget components."""
+        fonts = _get_fonts()
+        
         # Main frame
         self._frame = ctk.CTkFrame(self._parent, corner_radius=12)
         self._frame.pack(pady=10, padx=15, fill="x")
@@ -48,7 +66,7 @@ class PrefixConfigurationWidget:
         label = ctk.CTkLabel(
             container,
             text=f"{self._config.label}:",
-            font=ctk.CTkFont(size=13, weight="bold"),
+            font=fonts['label'],
             anchor="center"
         )
         label.grid(row=0, column=0, padx=5, sticky="ew")
@@ -59,7 +77,7 @@ class PrefixConfigurationWidget:
             container,
             textvariable=self._prefix_var,
             placeholder_text="Prefix",
-            font=ctk.CTkFont(size=12),
+            font=fonts['entry'],
             width=70,
             height=32,
             corner_radius=8,
@@ -71,7 +89,7 @@ class PrefixConfigurationWidget:
         hotkey_label = ctk.CTkLabel(
             container,
             text=f"Key: {self._config.hotkey}",
-            font=ctk.CTkFont(size=12, weight="bold"),
+            font=fonts['hotkey'],
             anchor="center",
             fg_color=("gray75", "gray25"),
             corner_radius=6,
@@ -84,7 +102,7 @@ class PrefixConfigurationWidget:
             container,
             text="Change Key",
             corner_radius=8,
-            font=ctk.CTkFont(size=11, weight="bold"),
+            font=fonts['button'],
             height=32,
             width=50,
             command=self._on_change_hotkey_clicked
@@ -131,15 +149,7 @@ class PrefixConfigurationWidget:
         
         if enabled:
             self._widgets['prefix_entry'].configure(state="normal")
-            
-            button = self._widgets['change_button']
-            button.configure(state="normal")
-
-            # Refresh the change button to fix visual artifacts...
-            original_text = button.cget("text")
-            button.configure(text=original_text + " ") 
-            button.update_idletasks()
-            button.configure(text=original_text)
+            self._widgets['change_button'].configure(state="normal")
         else:
             self._widgets['prefix_entry'].configure(state="disabled")
             self._widgets['change_button'].configure(state="disabled")
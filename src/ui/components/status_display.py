@@ -23,10 +23,12 @@ class StatusDisplay:
         self._status_label.pack(pady=(0, 20))
     
     def update_status(self, message: str) -> None:
-        """Update the status message."""
+        """Update the status message; must be called on the Tk thread."""
         if self._status_label:
+            # Other threads reach this through MinecraftSTTWindow._ui_call; Tk defers
+            # the repaint to idle time, so a burst of updates still draws only once
             self._status_label.configure(text=message)
-            self._logger.debug(f"Status updated: {message}")
+            self._logger.debug("Status updated: %s", message)
     
     def destroy(self) -> None:
         """Destroy the status display."""
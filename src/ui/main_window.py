@@ -1,55 +1,77 @@
 import logging
+import tkinter as tk
 import customtkinter as ctk
 import threading
-from typing import Dict, Optional
-import os
+from functools import partial
+from typing import Callable, Dict, Optional, Tuple, TYPE_CHECKING
 
-from services.voice_service import VoiceService
 from ui.components.prefix_configuration import PrefixConfigurationWidget
 from ui.components.status_display import StatusDisplay
 from ui.styles.theme_config import setup_theme
 from config.settings import app_settings, PrefixConfig
 from utils.exceptions import MinecraftSTTError
 
+if TYPE_CHECKING:
+    from services.voice_service import VoiceService
+
+
+_LOG = logging.getLogger(__name__)
+
 
 class MinecraftSTTWindow:
     """Main application window."""
     
     def __init__(self):
-        self._logger = logging.getLogger(__name__)
-        self._voice_service: Optional[VoiceService] = None
+        self._voice_service: Optional["VoiceService"] = None
         
         # Configuration state
         self._prefix_configs: Dict[str, PrefixConfig] = app_settings.default_prefix_configs.copy()
         self._auto_send_enabled = app_settings.default_auto_send
+        self._hotkey_mappings: Dict[str, str] = {
+            config.hotkey.lower(): config.prefix
+            for config in self._prefix_configs.values()
+        }
         
         # UI state
         self._is_running = False
-        self._is_binding_hotkey = False
         self._current_binding_prefix: Optional[str] = None
+        self._key_bind_id: Optional[str] = None
         self._is_model_ready = False
+        self._is_ui_enabled = False
         
         # UI components
         self._root: Optional[ctk.CTk] = None
         self._status_display: Optional[StatusDisplay] = None
+        self._prefix_frame: Optional[ctk.CTkFrame] = None
         self._prefix_widgets: Dict[str, PrefixConfigurationWidget] = {}
         self._control_buttons: Dict[str, ctk.CTkButton] = {}
+        self._toggleable_buttons: Tuple[ctk.CTkButton, ...] = ()
+        self._toggleable_widgets: Tuple[PrefixConfigurationWidget, ...] = ()
+        
+        # Theme colors, restored on buttons that were recolored
+        setup_theme()
+        button_theme = ctk.ThemeManager.theme["CTkButton"]
+        self._button_fg_color = button_theme["fg_color"]
+        self._button_hover_color = button_theme["hover_color"]
         
         self._setup_ui()
         self._initialize_voice_service()
     
     def _setup_ui(self) -> None:
         """Set up the user interface."""
-        setup_theme()
+        ui_settings = app_settings.ui
         
         # Create main window
         self._root = ctk.CTk()
-        self._root.title(app_settings.ui.window_title)
-        self._root.geometry(f"{app_settings.ui.window_width}x{app_settings.ui.window_height}")
+        self._root.title(ui_settings.window_title)
+        self._root.geometry(f"{ui_settings.window_width}x{ui_settings.window_height}")
         self._root.resizable(False, False)
         
-        if os.path.exists(app_settings.ui.icon_path):
-            self._root.after(201, lambda: self._root.iconbitmap(app_settings.ui.icon_path))
+        # CTk skips its delayed default icon once iconbitmap has been called
+        try:
+            self._root.iconbitmap(ui_settings.icon_path)
+        except tk.TclError:
+            _LOG.warning("Could not load window icon: %s", ui_settings.icon_path)
         
         # Create main frame
         main_frame = ctk.CTkFrame(self._root, corner_radius=15)
@@ -58,7 +80,7 @@ class MinecraftSTTWindow:
         # Title
         title_label = ctk.CTkLabel(
             main_frame,
-            text=app_settings.ui.window_title,
+            text=ui_settings.window_title,
             font=ctk.CTkFont(size=24, weight="bold")
         )
         title_label.pack(pady=(20, 10))
@@ -69,49 +91,46 @@ class MinecraftSTTWindow:
         # Control buttons
         self._create_control_buttons(main_frame)
         
-        # Prefix configuration
-        self._create_prefix_configuration(main_frame)
+        # Prefix configuration, rows are filled in after the window first paints
+        self._create_prefix_configuration_shell(main_frame)
+        self._root.after(50, self._build_prefix_widgets)
         
-        # Bind events
-        self._root.bind("<Key>", self._on_key_press)
         self._root.focus_set()
         
         # Initially disable all buttons
         self._set_ui_enabled(False)
         
-        self._logger.info("UI setup complete")
+        _LOG.info("UI setup complete")
     
     def _initialize_voice_service(self) -> None:
         """Initialize the voice service and start model loading."""
         def init_service():
             try:
-                # Create hotkey mappings
-                hotkey_mappings = {
-                    config.hotkey.lower(): config.prefix
-                    for config in self._prefix_configs.values()
-                }
+                # Imported here so the window shows before the audio/ML stack loads
+                from services.voice_service import VoiceService
                 
-                self._logger.info("Creating voice service...")
+                _LOG.info("Creating voice service...")
                 
                 # Create voice service
                 self._voice_service = VoiceService(
-                    hotkey_mappings=hotkey_mappings,
-                    status_callback=self._update_status,
-                    model_ready_callback=self._on_model_ready,
-                    auto_send=self._auto_send_enabled
+                    hotkey_mappings=self._hotkey_mappings,
+                    status_callback=lambda message: self._ui_call(self._update_status, message),
+                    model_ready_callback=lambda is_ready: self._ui_call(self._on_model_ready, is_ready),
+                    auto_send=self._auto_send_enabled,
+                    schedule_callback=self._root.after
                 )
                 
-                self._logger.info("Voice service created, starting model initialization...")
+                _LOG.info("Voice service created, starting model initialization...")
                 
                 # Start model initialization
                 self._voice_service.initialize_model()
                 
-                self._logger.info("Model initialization started")
+                _LOG.info("Model initialization started")
                 
             except Exception as error:
-                self._logger.error(f"Failed to initialize voice service: {error}")
-                self._update_status(f"Initialization failed: {error}")
-                self._set_ui_enabled(True)
+                _LOG.error("Failed to initialize voice service: %s", error)
+                self._ui_call(self._update_status, f"Initialization failed: {error}")
+                self._ui_call(self._set_ui_enabled, True)
         
         # Run initialization in separate thread
         init_thread = threading.Thread(
@@ -120,34 +139,45 @@ class MinecraftSTTWindow:
             name="ServiceInitializer"
         )
         init_thread.start()
-        self._logger.info("Service initialization thread started")
+        _LOG.info("Service initialization thread started")
+    
+    def _ui_call(self, callback: Callable[..., None], *args) -> None:
+        """Run a callback on the Tk thread; safe to call from any thread."""
+        self._root.after(0, callback, *args)
     
     def _on_model_ready(self, is_ready: bool) -> None:
         """Handle model ready callback."""
         self._is_model_ready = is_ready
         
         if is_ready:
-            self._logger.info("Speech recognition model is ready")
+            _LOG.info("Speech recognition model is ready")
             self._set_ui_enabled(True)
         else:
-            self._logger.error("Speech recognition model failed to load")
+            _LOG.error("Speech recognition model failed to load")
             self._update_status("Model loading failed. Please restart the application.")
     
     def _set_ui_enabled(self, enabled: bool) -> None:
         """Enable or disable UI controls."""
-        if not self._control_buttons:
+        self._is_ui_enabled = enabled
+        
+        if not self._toggleable_buttons:
             return
             
         state = "normal" if enabled else "disabled"
         
         # Enable/disable control buttons
-        for button in self._control_buttons.values():
+        for button in self._toggleable_buttons:
             button.configure(state=state)
         
         # Enable/disable prefix configuration widgets
-        for widget in self._prefix_widgets.values():
+        for widget in self._toggleable_widgets:
             widget.set_enabled(enabled)
     
+    def _rebuild_toggleable_cache(self) -> None:
+        """Snapshot the widgets that _set_ui_enabled toggles."""
+        self._toggleable_buttons = tuple(self._control_buttons.values())
+        self._toggleable_widgets = tuple(self._prefix_widgets.values())
+    
     def _create_control_buttons(self, parent: ctk.CTkFrame) -> None:
         """Create control buttons."""
         controls_frame = ctk.CTkFrame(parent, corner_radius=10)
@@ -193,9 +223,10 @@ class MinecraftSTTWindow:
             'start': start_button,
             'auto_send': auto_send_button
         }
+        self._rebuild_toggleable_cache()
     
-    def _create_prefix_configuration(self, parent: ctk.CTkFrame) -> None:
-        """Create prefix configuration section."""
+    def _create_prefix_configuration_shell(self, parent: ctk.CTkFrame) -> None:
+        """Create the prefix configuration section without its rows."""
         prefix_main_frame = ctk.CTkFrame(parent, height=300, corner_radius=10)
         prefix_main_frame.pack(pady=10, padx=20, fill="x")
         prefix_main_frame.pack_propagate(False)
@@ -207,16 +238,22 @@ class MinecraftSTTWindow:
             font=ctk.CTkFont(size=16, weight="bold")
         ).pack(pady=(15, 10))
         
-        # Create prefix widgets
+        self._prefix_frame = prefix_main_frame
+    
+    def _build_prefix_widgets(self) -> None:
+        """Create a configuration row for every prefix."""
         for prefix_id, config in self._prefix_configs.items():
             widget = PrefixConfigurationWidget(
-                prefix_main_frame,
+                self._prefix_frame,
                 prefix_id,
                 config,
-                lambda new_prefix, pid=prefix_id: self._on_prefix_changed(pid, new_prefix),
+                partial(self._on_prefix_changed, prefix_id),
                 self._start_hotkey_binding
             )
+            widget.set_enabled(self._is_ui_enabled)
             self._prefix_widgets[prefix_id] = widget
+        
+        self._rebuild_toggleable_cache()
     
     def _toggle_voice_chat(self) -> None:
         """Toggle voice chat on/off."""
@@ -248,7 +285,7 @@ class MinecraftSTTWindow:
             )
             
         except Exception as error:
-            self._logger.error(f"Error starting voice chat: {error}")
+            _LOG.error("Error starting voice chat: %s", error)
             self._update_status(f"Error: {str(error)}")
     
     def _stop_voice_chat(self) -> None:
@@ -260,8 +297,8 @@ class MinecraftSTTWindow:
         self._is_running = False
         self._control_buttons['start'].configure(
             text="Start VC",
-            fg_color=ctk.ThemeManager.theme["CTkButton"]["fg_color"],
-            hover_color=ctk.ThemeManager.theme["CTkButton"]["hover_color"]
+            fg_color=self._button_fg_color,
+            hover_color=self._button_hover_color
         )
         self._update_status("Stopped")
     
@@ -289,8 +326,8 @@ class MinecraftSTTWindow:
         """Update auto-send button color based on state."""
         if self._auto_send_enabled:
             button.configure(
-                fg_color=ctk.ThemeManager.theme["CTkButton"]["fg_color"],
-                hover_color=ctk.ThemeManager.theme["CTkButton"]["hover_color"]
+                fg_color=self._button_fg_color,
+                hover_color=self._button_hover_color
             )
         else:
             button.configure(
@@ -301,8 +338,10 @@ class MinecraftSTTWindow:
     def _on_prefix_changed(self, prefix_id: str, new_prefix: str) -> None:
         """Handle prefix configuration changes."""
         if prefix_id in self._prefix_configs:
-            self._prefix_configs[prefix_id].prefix = new_prefix
-            self._logger.info(f"Prefix {prefix_id} changed to: '{new_prefix}'")
+            config = self._prefix_configs[prefix_id]
+            config.prefix = new_prefix
+            self._hotkey_mappings[config.hotkey.lower()] = new_prefix
+            _LOG.info("Prefix %s changed to: '%s'", prefix_id, new_prefix)
             
             # Update service if running
             if self._voice_service:
@@ -314,9 +353,12 @@ class MinecraftSTTWindow:
             self._update_status("Stop voice chat first to change hotkeys")
             return
         
-        self._is_binding_hotkey = True
         self._current_binding_prefix = prefix_id
         
+        # Key events are only routed to Python while a hotkey is being bound
+        if self._key_bind_id is None:
+            self._key_bind_id = self._root.bind("<Key>", self._on_key_press)
+        
         # Update widget state
         widget = self._prefix_widgets[prefix_id]
         widget.set_change_button_state("Press key...", enabled=False)
@@ -329,21 +371,22 @@ class MinecraftSTTWindow:
     
     def _on_key_press(self, event) -> None:
         """Handle key press events for hotkey binding."""
-        if not self._is_binding_hotkey or not self._current_binding_prefix:
-            return
-        
         prefix_id = self._current_binding_prefix
+        config = self._prefix_configs[prefix_id]
         new_hotkey = event.keysym.upper()
+        new_hotkey_key = new_hotkey.lower()
+        current_hotkey_key = config.hotkey.lower()
         
         # Check for conflicts
-        for pid, config in self._prefix_configs.items():
-            if pid != prefix_id and config.hotkey == new_hotkey:
-                self._update_status(f"Hotkey {new_hotkey} already in use!")
-                self._reset_hotkey_binding(prefix_id)
-                return
+        if new_hotkey_key in self._hotkey_mappings and new_hotkey_key != current_hotkey_key:
+            self._update_status(f"Hotkey {new_hotkey} already in use!")
+            self._reset_hotkey_binding(prefix_id)
+            return
         
         # Update configuration
-        self._prefix_configs[prefix_id].hotkey = new_hotkey
+        del self._hotkey_mappings[current_hotkey_key]
+        self._hotkey_mappings[new_hotkey_key] = config.prefix
+        config.hotkey = new_hotkey
         
         # Update widget
         widget = self._prefix_widgets[prefix_id]
@@ -351,25 +394,30 @@ class MinecraftSTTWindow:
         widget.set_change_button_state("Change Key", enabled=True)
         
         # Update status
-        config = self._prefix_configs[prefix_id]
         self._update_status(f"Hotkey for {config.label} changed to: {new_hotkey}")
         
         # Reset binding state
-        self._is_binding_hotkey = False
-        self._current_binding_prefix = None
+        self._end_hotkey_binding()
         
         # Update service if running
         if self._voice_service:
             self._update_service_hotkey_mappings()
         
-        self._logger.info(f"Hotkey for {prefix_id} changed to: {new_hotkey}")
+        _LOG.info("Hotkey for %s changed to: %s", prefix_id, new_hotkey)
     
     def _reset_hotkey_binding(self, prefix_id: str) -> None:
         """Reset hotkey binding state."""
         widget = self._prefix_widgets[prefix_id]
         widget.set_change_button_state("Change Key", enabled=True)
         
-        self._is_binding_hotkey = False
+        self._end_hotkey_binding()
+    
+    def _end_hotkey_binding(self) -> None:
+        """Stop listening for key events and clear binding state."""
+        if self._key_bind_id is not None:
+            self._root.unbind("<Key>", self._key_bind_id)
+            self._key_bind_id = None
+        
         self._current_binding_prefix = None
     
     def _update_service_hotkey_mappings(self) -> None:
@@ -377,23 +425,18 @@ class MinecraftSTTWindow:
         if not self._voice_service:
             return
         
-        hotkey_mappings = {
-            config.hotkey.lower(): config.prefix
-            for config in self._prefix_configs.values()
-        }
-        
-        self._voice_service.update_hotkey_mappings(hotkey_mappings)
+        self._voice_service.update_hotkey_mappings(self._hotkey_mappings)
     
     def _update_status(self, message: str) -> None:
         """Update status display."""
         if self._status_display:
             self._status_display.update_status(message)
         
-        self._logger.info(f"Status: {message}")
+        _LOG.info("Status: %s", message)
     
     def _on_closing(self) -> None:
         """Handle window closing event."""
-        self._logger.info("Application closing")
+        _LOG.info("Application closing")
         if self._is_running:
             self._stop_voice_chat()
         
@@ -409,7 +452,7 @@ class MinecraftSTTWindow:
     
     def run(self) -> None:
         """Run the application."""
-        self._logger.info("Starting Minecraft-STT GUI")
+        _LOG.info("Starting Minecraft-STT GUI")
         
         if not self._root:
             raise MinecraftSTTError("UI not initialized")
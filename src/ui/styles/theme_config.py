@@ -4,6 +4,7 @@ from config.settings import app_settings
 
 def setup_theme() -> None:
     """Set up the application theme."""
-    ctk.set_appearance_mode(app_settings.ui.theme)
-    ctk.set_default_color_theme(app_settings.ui.color_theme)
+    ui_settings = app_settings.ui
+    ctk.set_appearance_mode(ui_settings.theme)
+    ctk.set_default_color_theme(ui_settings.color_theme)
 
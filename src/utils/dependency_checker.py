@@ -1,28 +1,42 @@
 import importlib
+from importlib.util import find_spec
 from utils.exceptions import DependencyError
 
 
-def check_dependencies() -> None:
-    """Check if all required dependencies are installed."""
-    required_modules = [
-        'sounddevice',
-        'numpy',
-        'keyboard',
-        'pynput',
-        'customtkinter',
-        'faster_whisper',
-        'win32gui',
-        'win32process',
-        'psutil'
-    ]
-    
-    missing_modules = []
-    
-    for module in required_modules:
+_REQUIRED_MODULES = (
+    'sounddevice',
+    'numpy',
+    'keyboard',
+    'pynput',
+    'customtkinter',
+    'faster_whisper',
+    'win32gui',
+    'win32process',
+    'psutil'
+)
+
+# pywin32 modules only fail once their DLLs are loaded, which find_spec can't detect
+_IMPORT_PROBED_MODULES = frozenset({'win32gui', 'win32process'})
+
+
+def _is_module_available(module: str) -> bool:
+    """Check whether a module can be found, importing it only when required."""
+    if module in _IMPORT_PROBED_MODULES:
         try:
             importlib.import_module(module)
         except ImportError:
-            missing_modules.append(module)
+            return False
+        return True
+    
+    return find_spec(module) is not None
+
+
+def check_dependencies() -> None:
+    """Check if all required dependencies are installed."""
+    missing_modules = [
+        module for module in _REQUIRED_MODULES
+        if not _is_module_available(module)
+    ]
     
     if missing_modules:
         error_message = (
@@ -1,24 +1,24 @@
 class MinecraftSTTError(Exception):
     """Base exception for all application errors."""
-    pass
+    __slots__ = ()
 
 
 class DependencyError(MinecraftSTTError):
     """Raised when required dependencies are missing."""
-    pass
+    __slots__ = ()
 
 
 class AudioProcessingError(MinecraftSTTError):
     """Raised when audio processing fails."""
-    pass
+    __slots__ = ()
 
 
 class HotkeyError(MinecraftSTTError):
     """Raised when hotkey binding fails."""
-    pass
+    __slots__ = ()
 
 
 class MessageSendError(MinecraftSTTError):
     """Raised when message sending fails."""
-    pass
+    __slots__ = ()
 
@@ -1,9 +1,14 @@
+import atexit
 import logging
+import queue
 import sys
 import os
+from logging.handlers import QueueHandler, QueueListener
+from functools import lru_cache
 from pathlib import Path
 
 
+@lru_cache(maxsize=1)
 def get_minecraft_stt_log_path() -> Path:
     """Get the path to the minecraft-STT log directory"""
     appdata_roaming = os.getenv('APPDATA')
@@ -27,22 +32,26 @@ def setup_logging(
         clear_on_start: bool = True
     ) -> None:
     """Set up logging configuration."""
+    if logging.getLogger().handlers:
+        return
     
     log_path = Path(get_minecraft_stt_log_path()) / log_file
 
-    if clear_on_start and log_path.exists():
-        try:
-            log_path.unlink()
-        except Exception as e:
-            print(f"Could not clear log file: {e}")
+    # mode='w' truncates the old log; delay=True defers opening until the first record
+    file_handler = logging.FileHandler(log_path, mode='w' if clear_on_start else 'a', delay=True)
+    console_handler = logging.StreamHandler(sys.stdout)
 
+    # Callers only enqueue records; a listener thread does the file and console I/O
+    log_queue = queue.Queue(-1)
+    listener = QueueListener(log_queue, file_handler, console_handler, respect_handler_level=True)
+    listener.start()
+    atexit.register(listener.stop)
+
+    # The queue handler formats each record, the listener's handlers write it as-is
     logging.basicConfig(
         level=level,
         format=format_string,
-        handlers=[
-            logging.FileHandler(log_path, mode='w'),
-            logging.StreamHandler(sys.stdout)
-        ]
+        handlers=[QueueHandler(log_queue)]
     )
 
     logging.getLogger('faster_whisper').setLevel(logging.WARNING)